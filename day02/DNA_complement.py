@@ -1,19 +1,11 @@
 #!/usr/bin/env python3
 import sys
 
+_COMPLEMENT_TABLE = str.maketrans('ACGTacgt', 'TGCAtgca')
+
 def get_dna_complement(sequence):
     """Return the complement of a DNA sequence"""
-    DNA_complement = ""
-    for base in sequence:
-        if base == "A":
-            DNA_complement += "T"
-        elif base == "G":
-            DNA_complement += "C"
-        elif base == "T":
-            DNA_complement += "A"
-        elif base == "C":
-            DNA_complement += "G"
-    return DNA_complement
+    return sequence.translate(_COMPLEMENT_TABLE)
 
 def main():
     # Check if a sequence was provided
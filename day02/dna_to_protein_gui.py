@@ -1,28 +1,85 @@
+import functools
 import tkinter as tk
 from tkinter import messagebox
+from types import MappingProxyType
+
+# Bases packed as 2-bit codes (A=0, C=1, G=2, T=3); anything else maps to 0xFF
+_BASE_ENCODE = bytes(b'ACGT'.find(bytes([b])) & 0xFF for b in range(256))
+_STOP = ord('*')
+_SKIP = 0  # Table entry for codons missing from the genetic code
+_ENCODED_ATG = b'ATG'.translate(_BASE_ENCODE)
+
+
+def _build_codon_table(genetic_code):
+    """Pack a codon dictionary into a 64-byte table indexed by 2-bit codons
+
+    Codons missing from genetic_code get _SKIP and are left out of the protein.
+    """
+    return bytes(ord(genetic_code.get(b0 + b1 + b2) or chr(_SKIP))
+                 for b0 in 'ACGT' for b1 in 'ACGT' for b2 in 'ACGT')
+
+
+@functools.lru_cache(maxsize=128)
+def _translate_cached(dna_sequence, codon_table):
+    """Translate an uppercased DNA sequence using a 64-byte codon table"""
+    # Work on ASCII bytes (one byte per base)
+    dna = dna_sequence.encode('ascii', 'replace')
+
+    # Encode every base once so each codon becomes a 6-bit table index
+    encoded = dna.translate(_BASE_ENCODE)
+
+    # Find start codon in the encoded buffer; the loop indexes from it
+    start_pos = encoded.find(_ENCODED_ATG)
+    if start_pos == -1:
+        # If no start codon found, start from beginning
+        start_pos = 0
+
+    protein = bytearray()
+    append = protein.append
+
+    # Walk the reading frame one codon per step, taking its first, second
+    # and third bases from three every-third-byte slices
+    for b0, b1, b2 in zip(encoded[start_pos::3], encoded[start_pos+1::3],
+                          encoded[start_pos+2::3]):
+        key = (b0 << 4) | (b1 << 2) | b2
+        if key >= 64:  # Codon contains a non-ACGT base
+            continue
+        amino_acid = codon_table[key]
+        if amino_acid == _STOP:  # Stop codon found
+            break
+        if amino_acid != _SKIP:
+            append(amino_acid)
+
+    return protein.decode('ascii')
+
 
 class DNATranslator:
+    # Genetic code dictionary using one-letter codes (shared by all instances,
+    # so read-only; override by assigning a new mapping, e.g. in tests)
+    GENETIC_CODE = MappingProxyType({
+        'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
+        'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L',
+        'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M',
+        'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V',
+        'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
+        'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P',
+        'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T',
+        'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
+        'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
+        'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q',
+        'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K',
+        'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
+        'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W',
+        'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R',
+        'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R',
+        'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
+    })
+    # Packed table and the mapping it was built from; assigning a new
+    # GENETIC_CODE (e.g. on an instance in tests) rebuilds it on next use
+    _codon_table_source = GENETIC_CODE
+    _codon_table = _build_codon_table(GENETIC_CODE)
+
     def __init__(self):
-        # Genetic code dictionary using one-letter codes
-        self.genetic_code = {
-            'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
-            'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L',
-            'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M',
-            'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V',
-            'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
-            'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P',
-            'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T',
-            'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
-            'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
-            'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q',
-            'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K',
-            'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
-            'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W',
-            'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R',
-            'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R',
-            'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
-        }
-        
         self.create_gui()
 
     def create_gui(self):
@@ -90,33 +147,17 @@ class DNATranslator:
         sequence_bases = set(sequence.upper())
         return sequence_bases.issubset(valid_bases)
 
+    def _get_codon_table(self):
+        """Return the 64-byte codon table for the current GENETIC_CODE"""
+        if self.GENETIC_CODE is not self._codon_table_source:
+            self._codon_table_source = self.GENETIC_CODE
+            self._codon_table = _build_codon_table(self.GENETIC_CODE)
+        return self._codon_table
+
     def translate_dna_to_protein(self, dna_sequence):
         """Translate DNA sequence to protein sequence"""
-        # Convert to uppercase for consistency
-        dna = dna_sequence.upper()
-        
-        # Find start codon
-        start_pos = dna.find('ATG')
-        if start_pos == -1:
-            # If no start codon found, start from beginning
-            start_pos = 0
-        
-        # Initialize protein sequence
-        protein = []
-        
-        # Translate codons
-        i = start_pos
-        while i + 2 < len(dna):
-            codon = dna[i:i+3]
-            if len(codon) == 3:  # Only process complete codons
-                amino_acid = self.genetic_code.get(codon, '')
-                if amino_acid == '*':  # Stop codon found
-                    break
-                if amino_acid:  # Valid codon found
-                    protein.append(amino_acid)
-            i += 3
-            
-        return ''.join(protein)
+        # Uppercase first so repeated inputs hit the same cache entry
+        return _translate_cached(dna_sequence.upper(), self._get_codon_table())
 
     def translate_sequence(self):
         """Handle the translation process and GUI updates"""
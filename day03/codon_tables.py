@@ -0,0 +1,95 @@
+"""Shared genetic code tables for DNA to Protein translation.
+
+Built once at import and shared by `logic.py` and `dna_to_protein_gui.py`:
+- GENETIC_CODE: read-only codon -> one-letter amino acid mapping ('*' = stop)
+- BASE_ENCODE_LUT: 256-byte bytes.translate table packing bases as 2-bit codes
+- CODON_LUT_2BIT: 64-byte table of ASCII amino acid codes indexed by
+  (b0 << 4) | (b1 << 2) | b2 for 2-bit encoded bases b0, b1, b2
+- translate_encoded: the pure-Python codon loop over these tables
+"""
+
+from types import MappingProxyType
+from typing import Mapping
+
+# Standard genetic code (one-letter amino acids, '*' marks stop codons)
+GENETIC_CODE: Mapping[str, str] = MappingProxyType({
+    'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
+    'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L',
+    'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M',
+    'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V',
+    'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
+    'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P',
+    'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T',
+    'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
+    'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
+    'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q',
+    'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K',
+    'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
+    'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W',
+    'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R',
+    'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R',
+    'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
+})
+
+# Bases packed as 2-bit codes (A=0, C=1, G=2, T=3, either case); anything
+# else maps to INVALID_BASE. BASE_DECODE_LUT turns codes back into letters.
+INVALID_BASE = 0xFF
+BASE_ENCODE_LUT = bytes(b'ACGT'.find(bytes([b]).upper()) & INVALID_BASE for b in range(256))
+BASE_DECODE_LUT = bytes(b'ACGT'[b] if b < 4 else ord('N') for b in range(256))
+
+CODON_LUT_2BIT = bytes(
+    ord(GENETIC_CODE[b0 + b1 + b2])
+    for b0 in 'ACGT' for b1 in 'ACGT' for b2 in 'ACGT'
+)
+STOP_CODE = ord('*')
+ENCODED_ATG = b'ATG'.translate(BASE_ENCODE_LUT)
+ENCODED_STOPS = tuple(
+    codon.encode('ascii').translate(BASE_ENCODE_LUT)
+    for codon, amino_acid in GENETIC_CODE.items() if amino_acid == '*'
+)
+
+
+def _find_stop(encoded: bytes, start: int) -> int:
+    """Return the index of the first stop codon in frame with start.
+
+    Each stop codon is searched with bytes.find, skipping out-of-frame hits.
+    Every later search is bounded by the earliest stop found so far.
+
+    Returns:
+        Index of the stop codon, or len(encoded) if there is none
+    """
+    end = len(encoded)
+    for stop in ENCODED_STOPS:
+        pos = encoded.find(stop, start, end)
+        while pos != -1 and (pos - start) % 3:
+            pos = encoded.find(stop, pos + 1, end)
+        if pos != -1:
+            end = pos
+    return end
+
+
+def translate_encoded(encoded: bytes, start: int) -> str:
+    """Translate 2-bit encoded bases from start up to the first in-frame stop.
+
+    Codons containing a non-ACGT base (INVALID_BASE) are skipped and an
+    incomplete trailing codon is ignored.
+
+    Args:
+        encoded: Bases translated with BASE_ENCODE_LUT
+        start: Index of the first base of the reading frame
+
+    Returns:
+        Protein sequence as one-letter amino acid codes
+    """
+    # The stop is located up front, so the loop only walks the coding region
+    # and never has to test for it
+    end = _find_stop(encoded, start)
+    protein = bytearray()
+    append = protein.append  # Avoid the attribute lookup per codon
+    # Strided slices give each codon's bases without per-base indexing; zip
+    # stops at the last complete codon
+    for b0, b1, b2 in zip(encoded[start:end:3], encoded[start + 1:end:3], encoded[start + 2:end:3]):
+        key = (b0 << 4) | (b1 << 2) | b2
+        if key < 64:
+            append(CODON_LUT_2BIT[key])
+    return protein.decode('ascii')
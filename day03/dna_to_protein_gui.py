@@ -1,34 +1,4 @@
 #!/usr/bin/env python3
-"""
-Improved DNA -> Protein GUI using ttkbootstrap (modern theming) and Biopython
-for translation logic.
-
-This module exposes a helper `translate_sequence_from_text(seq_text)` which the
-GUI uses. The GUI itself is only created when running the module as __main__.
-"""
-from typing import Optional
-import re
-
-try:
-    import ttkbootstrap as tb
-    from ttkbootstrap.constants import LEFT, RIGHT
-except Exception:
-    #!/usr/bin/env python3
-    """
-    Improved DNA -> Protein GUI using ttkbootstrap (modern theming) and Biopython
-    for translation logic.
-
-    This module exposes a helper `translate_sequence_from_text(seq_text)` which the
-    GUI uses. The GUI itself is only created when running the module as __main__.
-    """
-    import re
-    from typing import Optional
-
-    try:
-        import ttkbootstrap as tb
-    except Exception:
-        tb = None  # fallback to tkinter if ttkbootstrap is not installed
-#!/usr/bin/env python3
 """DNA -> Protein translator GUI and helper.
 
 This module provides:
@@ -38,14 +8,8 @@ This module provides:
 The GUI is only constructed when the module is run as __main__.
 """
 
+import functools
 from typing import Optional
-import re
-
-# Optional UI/theme library (nice but not required)
-try:
-    import ttkbootstrap as tb
-except Exception:
-    tb = None
 
 # Optional Biopython for robust translation
 try:
@@ -53,14 +17,19 @@ try:
 except Exception:
     Seq = None
 
-GENETIC_CODE_REGEX = re.compile(r'^[ATCGatcg]+$')
+# Shared 2-bit tables and codon loop, used when Biopython is unavailable
+from codon_tables import BASE_ENCODE_LUT, ENCODED_ATG, translate_encoded
+
+# Deletes every valid base; anything left over is invalid
+_DELETE_VALID_BASES = str.maketrans('', '', 'ACGTacgt')
 
 
 def validate_sequence(sequence: str) -> bool:
     """Return True if sequence contains only A,T,C,G (case-insensitive)."""
     if not sequence:
         return False
-    return bool(GENETIC_CODE_REGEX.fullmatch(sequence.strip()))
+    stripped = sequence.strip()
+    return bool(stripped) and not stripped.translate(_DELETE_VALID_BASES)
 
 
 def translate_sequence_from_text(sequence: str) -> str:
@@ -76,61 +45,44 @@ def translate_sequence_from_text(sequence: str) -> str:
     if not sequence:
         return ""
 
-    dna = sequence.upper().strip()
-    start = dna.find('ATG')
-    if start == -1:
-        start = 0
+    # Canonical cache key: repeated clicks on the same input skip translation
+    return _translate_text_cached(sequence.upper().strip())
 
-    coding = dna[start:]
 
-    # Prefer Biopython if available (handles translation reliably)
+@functools.lru_cache(maxsize=128)
+def _translate_text_cached(sequence: str) -> str:
+    """Translate an uppercased, stripped DNA sequence (memoised)."""
+    dna = sequence.encode('ascii', 'replace')
+
+    # Biopython handles translation when installed; the local table is only
+    # for environments without it
     if Seq is not None:
-        try:
-            return str(Seq(coding).translate(to_stop=True))
-        except Exception:
-            # Fall through to local translator on any unexpected error
-            pass
-
-    # Local fallback genetic code
-    genetic_code = {
-        'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
-        'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L',
-        'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M',
-        'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V',
-        'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
-        'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P',
-        'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T',
-        'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
-        'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
-        'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q',
-        'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K',
-        'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
-        'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W',
-        'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R',
-        'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R',
-        'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
-    }
-
-    protein = []
-    i = 0
-    while i + 2 < len(coding):
-        codon = coding[i:i+3]
-        aa = genetic_code.get(codon, '')
-        if aa == '*':
-            break
-        if aa:
-            protein.append(aa)
-        i += 3
-
-    return ''.join(protein)
+        start = max(dna.find(b'ATG'), 0)
+        return str(Seq(dna[start:]).translate(to_stop=True))
+
+    encoded = dna.translate(BASE_ENCODE_LUT)
+    return translate_encoded(encoded, max(encoded.find(ENCODED_ATG), 0))
+
+
+def _load_ttkbootstrap():
+    """Import the optional UI/theme library (nice but not required).
+
+    Deferred until a window is built so translation-only callers never load Tk.
+    """
+    try:
+        import ttkbootstrap as tb
+    except Exception:
+        return None
+    return tb
 
 
 class DNATranslatorGUI:
     """Small GUI wrapper using ttkbootstrap when available."""
 
     def __init__(self):
-        if tb is not None:
-            self.root = tb.Window(title='DNA to Protein Translator')
+        self.tb = _load_ttkbootstrap()
+        if self.tb is not None:
+            self.root = self.tb.Window(title='DNA to Protein Translator')
         else:
             import tkinter as tk
             self.root = tk.Tk()
@@ -139,6 +91,7 @@ class DNATranslatorGUI:
         self._build()
 
     def _build(self):
+        tb = self.tb
         if tb is not None:
             Frame = tb.Frame
             Label = tb.Label
@@ -4,8 +4,8 @@ This module handles DNA sequence validation and translation to protein sequences
 using the standard genetic code table.
 """
 
-import re
-from typing import Optional
+import functools
+from typing import Callable, Optional, Tuple
 
 try:
     from Bio.Seq import Seq
@@ -13,10 +13,91 @@ try:
     BIOPYTHON_AVAILABLE = True
 except ImportError:
     BIOPYTHON_AVAILABLE = False
+    Seq = None
     standard_dna_table = None
 
-
-GENETIC_CODE_REGEX = re.compile(r'^[ATCGatcg]+$')
+# Resolved once at import: the Biopython translator and its codon table
+_BIO_TRANSLATE = Seq if BIOPYTHON_AVAILABLE else None
+_BIO_CODON_TABLE = standard_dna_table
+
+# Optional NumPy (vectorised codon lookup on long sequences) and Numba (JIT
+# for the local codon loop). Both only back the local table, so they are not
+# imported at all when Biopython is the translator.
+NUMPY_AVAILABLE = False
+NUMBA_AVAILABLE = False
+if not BIOPYTHON_AVAILABLE:
+    try:
+        import numpy as np
+        NUMPY_AVAILABLE = True
+    except ImportError:
+        pass
+
+    # Numba depends on NumPy
+    try:
+        from numba import njit
+        NUMBA_AVAILABLE = NUMPY_AVAILABLE
+    except ImportError:
+        pass
+
+from codon_tables import (
+    BASE_DECODE_LUT,
+    BASE_ENCODE_LUT,
+    CODON_LUT_2BIT,
+    ENCODED_ATG,
+    INVALID_BASE,
+    STOP_CODE,
+    translate_encoded,
+)
+
+
+# Below this length the NumPy setup costs more than the plain loop
+_VECTORIZE_MIN_LENGTH = 1024
+
+if NUMPY_AVAILABLE:
+    _CODON_ARRAY = np.frombuffer(CODON_LUT_2BIT, dtype=np.uint8)
+
+
+def _translate_vectorized(encoded: bytes, start: int) -> str:
+    """Translate 2-bit encoded bases with a single NumPy gather over all codons.
+
+    Codons containing a non-ACGT base are dropped, then the result is cut at
+    the first stop codon.
+    """
+    bases = np.frombuffer(encoded, dtype=np.uint8, offset=start)
+    codons = bases[:bases.size // 3 * 3].reshape(-1, 3).astype(np.uint16)
+    keys = (codons[:, 0] << 4) | (codons[:, 1] << 2) | codons[:, 2]
+    amino = _CODON_ARRAY[keys[keys < 64]]
+    stops = np.flatnonzero(amino == STOP_CODE)
+    end = stops[0] if stops.size else amino.size
+    return amino[:end].tobytes().decode('ascii')
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _translate_encoded_jit(encoded, start, codon_table):
+        """Translate 2-bit encoded bases from ``start`` up to the first stop codon.
+
+        Returns the amino acids as a uint8 array of ASCII codes.
+        """
+        protein = np.empty((encoded.size - start) // 3, dtype=np.uint8)
+        count = 0
+        for i in range(start, encoded.size - 2, 3):
+            b0 = np.intp(encoded[i])
+            b1 = np.intp(encoded[i + 1])
+            b2 = np.intp(encoded[i + 2])
+            key = (b0 << 4) | (b1 << 2) | b2
+            if key >= 64:
+                continue
+            aa = codon_table[key]
+            if aa == STOP_CODE:
+                break
+            protein[count] = aa
+            count += 1
+        return protein[:count]
+
+    # Compile up front (with the read-only buffer type used at runtime) so the
+    # first translation does not pay for the JIT
+    _translate_encoded_jit(np.frombuffer(bytes(3), dtype=np.uint8), 0, _CODON_ARRAY)
 
 
 def validate_sequence(sequence: str) -> bool:
@@ -30,7 +111,8 @@ def validate_sequence(sequence: str) -> bool:
     """
     if not sequence:
         return False
-    return bool(GENETIC_CODE_REGEX.fullmatch(sequence.strip()))
+    encoded, _ = _prepare(sequence)
+    return bool(encoded) and INVALID_BASE not in encoded
 
 
 def translate_dna_to_protein(sequence: str) -> str:
@@ -53,69 +135,117 @@ def translate_dna_to_protein(sequence: str) -> str:
     if not sequence:
         return ""
 
-    dna = sequence.upper().strip()
-
-    # Find start codon (ATG)
-    start = dna.find('ATG')
-    if start == -1:
-        start = 0
-
-    coding = dna[start:]
-
-    # Use Biopython if available
-    if BIOPYTHON_AVAILABLE:
-        try:
-            seq_obj = Seq(coding)
-            protein = str(seq_obj.translate(to_stop=True))
-            return protein
-        except Exception:
-            # Fall through to local implementation
-            pass
-
-    # Fallback: Use standard genetic code from Biopython if available
-    if BIOPYTHON_AVAILABLE and standard_dna_table:
-        try:
-            protein = []
-            for i in range(0, len(coding) - 2, 3):
-                codon = coding[i:i+3]
-                if len(codon) == 3:
-                    aa = standard_dna_table.forward_table.get(codon, '*')
-                    if aa == '*':
-                        break
-                    protein.append(aa)
-            return ''.join(protein)
-        except Exception:
-            pass
-
-    # Last resort: Local genetic code dictionary
-    genetic_code = {
-        'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
-        'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L',
-        'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M',
-        'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V',
-        'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S',
-        'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P',
-        'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T',
-        'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A',
-        'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*',
-        'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q',
-        'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K',
-        'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E',
-        'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W',
-        'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R',
-        'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R',
-        'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
-    }
-
-    protein = []
-    i = 0
-    while i + 2 < len(coding):
-        codon = coding[i:i+3]
-        aa = genetic_code.get(codon, '')
-        if aa == '*':
-            break
-        if aa:
-            protein.append(aa)
-        i += 3
-
-    return ''.join(protein)
+    # The encoded form is case-insensitive, so repeated inputs share one cache
+    # entry regardless of case or surrounding whitespace
+    return _translate_cached(*_prepare(sequence))
+
+
+@functools.lru_cache(maxsize=16)
+def _prepare(sequence: str) -> Tuple[bytes, int]:
+    """Encode a sequence to 2-bit bases and locate its first ATG.
+
+    Stripping, case folding, encoding and validation data all come from a
+    single bytes.translate pass; invalid characters (including non-ASCII,
+    which is replaced by '?') become INVALID_BASE. The result is cached, so
+    the GUI's validate-then-translate sequence encodes the input only once.
+
+    Returns:
+        Tuple of (encoded bases, start index; 0 if there is no ATG)
+    """
+    encoded = sequence.strip().encode('ascii', 'replace').translate(BASE_ENCODE_LUT)
+    return encoded, max(encoded.find(ENCODED_ATG), 0)
+
+
+@functools.lru_cache(maxsize=128)
+def _translate_cached(encoded: bytes, start: int) -> str:
+    """Translate 2-bit encoded bases from start (see _prepare); results are memoised."""
+    # Biopython is the only path when installed (caller validates first)
+    if _BIO_TRANSLATE is not None:
+        coding = _BIO_TRANSLATE(encoded[start:].translate(BASE_DECODE_LUT))
+        return str(coding.translate(table=_BIO_CODON_TABLE, to_stop=True))
+
+    # No Biopython: local 2-bit codon table (the Numba and NumPy paths index
+    # from start without copying the tail)
+    if NUMBA_AVAILABLE:
+        protein = _translate_encoded_jit(np.frombuffer(encoded, dtype=np.uint8), start, _CODON_ARRAY)
+        return protein.tobytes().decode('ascii')
+
+    if NUMPY_AVAILABLE and len(encoded) - start >= _VECTORIZE_MIN_LENGTH:
+        return _translate_vectorized(encoded, start)
+
+    return translate_encoded(encoded, start)
+
+
+# Codons handled per iteration of the loop generated by make_translator
+_UNROLL = 8
+
+_TRANSLATOR_SOURCE = """\
+def bind(codon_table, base_encode, encoded_atg, stop, invalid):
+    def translate(dna):
+        encoded = dna.strip().translate(base_encode)
+        if len(encoded) > {max_len}:
+            raise ValueError('sequence longer than {max_len} bases')
+        start = max(encoded.find(encoded_atg), 0)
+        # Pad to the fixed length so every input runs the same loop bounds
+        encoded = encoded.ljust({padded_len}, invalid)
+        protein = bytearray()
+        append = protein.append
+        for i in range(start, {loop_end}, {stride}):
+{steps}        return bytes(protein)
+    return translate
+"""
+
+_CODON_STEP_SOURCE = """\
+            key = (encoded[i + {0}] << 4) | (encoded[i + {1}] << 2) | encoded[i + {2}]
+            if key < 64:
+                aa = codon_table[key]
+                if aa == stop:
+                    return bytes(protein)
+                append(aa)
+"""
+
+
+def make_translator(max_len: int) -> Callable[[bytes], bytes]:
+    """Build a translator specialised for sequences of a fixed maximum length.
+
+    Intended for pipelines translating many sequences of the same length
+    (e.g. tiled scans). The returned function follows the same rules as
+    translate_dna_to_protein but takes and returns ASCII bytes, and always
+    uses the local codon table. Its source is generated with max_len as a
+    literal: inputs are padded to that length, so the loop has a constant
+    trip count, with the codon step unrolled _UNROLL times. Translators are
+    cached per max_len.
+
+    Args:
+        max_len: Longest sequence (in bases) the translator must accept
+
+    Returns:
+        Function mapping DNA bytes to protein bytes; it raises ValueError for
+        sequences longer than max_len
+    """
+    if max_len < 1:
+        raise ValueError('max_len must be positive')
+    return _build_translator(max_len)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_translator(max_len: int) -> Callable[[bytes], bytes]:
+    """Generate, compile and bind the unrolled translator for one length."""
+    steps = ''.join(
+        _CODON_STEP_SOURCE.format(3 * k, 3 * k + 1, 3 * k + 2) for k in range(_UNROLL)
+    )
+    # Invalid-base padding covers the sequence up to max_len and lets the last
+    # unrolled block read past its end; those codons fail key < 64 and are
+    # skipped
+    source = _TRANSLATOR_SOURCE.format(
+        max_len=max_len,
+        padded_len=max_len + 3 * _UNROLL - 3,
+        loop_end=max(max_len - 2, 0),
+        stride=3 * _UNROLL,
+        steps=steps,
+    )
+    namespace = {}
+    exec(compile(source, f'<translator max_len={max_len}>', 'exec'), namespace)
+    return namespace['bind'](
+        CODON_LUT_2BIT, BASE_ENCODE_LUT, ENCODED_ATG, STOP_CODE, bytes([INVALID_BASE])
+    )
@@ -1,6 +1,11 @@
 """Tests for DNA to Protein translation logic."""
 
-from logic import translate_dna_to_protein, validate_sequence
+import importlib
+import sys
+
+import pytest
+
+from logic import make_translator, translate_dna_to_protein, validate_sequence
 
 
 def test_translation_starts_at_first_atg():
@@ -22,3 +27,60 @@ def test_lowercase_input():
     """Test that lowercase input is handled correctly."""
     assert translate_dna_to_protein('atgaaaTGG') == 'MKW'
 
+
+def test_validate_sequence():
+    """Test that only non-empty A/T/C/G sequences are accepted."""
+    assert validate_sequence('ATGcgt')
+    assert validate_sequence('  ATG\n')
+    assert not validate_sequence('ATGN')
+    assert not validate_sequence('AT G')
+    assert not validate_sequence('')
+    assert not validate_sequence('   ')
+
+
+def test_make_translator_matches_translate():
+    """Test that a length-specialised translator follows the same rules."""
+    translate = make_translator(64)
+    assert translate(b'AAAATGAAACCC') == b'MKP'
+    assert translate(b'ATGAAATAGGGT') == b'MK'
+    assert translate(b'TTTGGGCC') == b'FG'
+    sequence = 'ATG' + 'GCCAAAtgg' * 6
+    assert translate(sequence.encode()).decode() == translate_dna_to_protein(sequence)
+    with pytest.raises(ValueError):
+        translate(b'A' * 65)
+
+
+@pytest.fixture(params=['numba', 'numpy', 'loop'])
+def local_logic(request, monkeypatch):
+    """logic imported without Biopython, limited to one local backend."""
+    # Re-import with Bio blocked so the NumPy/Numba backends get set up
+    for name in [name for name in sys.modules if name.split('.')[0] == 'Bio'] + ['Bio']:
+        monkeypatch.setitem(sys.modules, name, None)
+    monkeypatch.delitem(sys.modules, 'logic')
+    module = importlib.import_module('logic')
+    monkeypatch.setattr(module, '_BIO_TRANSLATE', None)
+    if request.param == 'numba' and not module.NUMBA_AVAILABLE:
+        pytest.skip('numba not installed')
+    if request.param == 'numpy' and not module.NUMPY_AVAILABLE:
+        pytest.skip('numpy not installed')
+    if request.param != 'numba':
+        monkeypatch.setattr(module, 'NUMBA_AVAILABLE', False)
+    if request.param == 'loop':
+        monkeypatch.setattr(module, 'NUMPY_AVAILABLE', False)
+    module._translate_cached.cache_clear()
+    yield module
+    module._translate_cached.cache_clear()
+
+
+def test_local_backends_follow_translation_rules(local_logic):
+    """Test the built-in codon table backends used without Biopython."""
+    translate = local_logic.translate_dna_to_protein
+    assert translate('AAAATGAAACCC') == 'MKP'
+    # TAA at 4 and TAG at 10 are out of frame; the in-frame TAG at 15 stops
+    assert translate('ATGATAAGCGTAGCCTAG') == 'MISVA'
+    assert translate('ATGTAAGCC') == 'M'
+    assert translate('ATGGCCAA') == 'MA'
+    assert translate('atgaaaTGG') == 'MKW'
+    # Long enough for the NumPy path (out-of-frame TAA, then an in-frame TGA)
+    long_sequence = 'ATG' + 'GCC' * 400 + 'CTAAGC' + 'TGA' + 'GGG'
+    assert translate(long_sequence) == 'M' + 'A' * 400 + 'LS'
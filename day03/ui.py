@@ -3,16 +3,20 @@
 Provides a Tkinter interface for translating DNA sequences to protein sequences.
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox
+from typing import TYPE_CHECKING
 
 from logic import validate_sequence, translate_dna_to_protein
 
+# Tkinter is imported where the window is built, so importing this module
+# (or logic through it) does not load Tk
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class DNATranslatorGUI:
     """Tkinter GUI for DNA to Protein translation."""
 
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: 'tk.Tk'):
         """Initialize the GUI.
 
         Args:
@@ -27,6 +31,9 @@ class DNATranslatorGUI:
 
     def _build_ui(self):
         """Build the user interface."""
+        import tkinter as tk
+        from tkinter import ttk
+
         # Main frame
         main_frame = ttk.Frame(self.root, padding='10')
         main_frame.grid(row=0, column=0, sticky='nsew')
@@ -107,6 +114,8 @@ class DNATranslatorGUI:
 
     def _on_translate(self):
         """Handle translate button click."""
+        from tkinter import messagebox
+
         seq = self.input_text.get('1.0', 'end').strip()
 
         if not seq:
@@ -136,6 +145,8 @@ class DNATranslatorGUI:
 
 def main():
     """Launch the application."""
+    import tkinter as tk
+
     root = tk.Tk()
     app = DNATranslatorGUI(root)
     app.run()
@@ -5,6 +5,7 @@ configuration for API queries and application settings.
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -17,33 +18,55 @@ except ImportError:
 
 
 class Config:
-    """Configuration holder for the application."""
+    """Configuration holder for the application.
+
+    Environment variables are read on first access and cached; nothing touches
+    the filesystem beyond the optional .env load until a value is needed.
+    """
 
     def __init__(self):
-        """Initialize configuration from environment variables."""
-        # Load .env file if available
+        """Initialize configuration, loading the .env file if available."""
+        # Load .env file first so the lazy getters below see its values
         env_path = Path(__file__).parent / '.env'
-        if env_path.exists() and DOTENV_AVAILABLE:
+        if DOTENV_AVAILABLE and env_path.exists():
             load_dotenv(env_path)
 
-        # Required configuration
-        self.contact_email: str = os.getenv(
+        # API configuration
+        self.uniprotkb_base_url: str = 'https://rest.uniprot.org/uniprotkb/search'
+        self.uniprotkb_entry_url: str = 'https://rest.uniprot.org/uniprotkb'
+
+    @cached_property
+    def contact_email(self) -> str:
+        """Contact email sent with API requests (required by UniProtKB)."""
+        return os.getenv(
             'CONTACT_EMAIL',
             'user@example.com'  # Default email for API requests
         )
 
-        # Optional configuration
-        self.output_dir: str = os.getenv(
+    @cached_property
+    def output_dir(self) -> str:
+        """Output directory path, created on first access."""
+        output_dir = os.getenv(
             'OUTPUT_DIR',
             str(Path(__file__).parent / 'output')
         )
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return output_dir
 
-        # API configuration
-        self.uniprotkb_base_url: str = 'https://rest.uniprot.org/uniprotkb/search'
-        self.uniprotkb_entry_url: str = 'https://rest.uniprot.org/uniprotkb'
+    @cached_property
+    def cache_dir(self) -> str:
+        """Directory for cached UniProtKB entries, created on first access."""
+        cache_dir = os.getenv(
+            'CACHE_DIR',
+            str(Path.home() / '.cache' / 'uniprotkb-finder')
+        )
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        return cache_dir
 
-        # Ensure output directory exists
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+    @cached_property
+    def sync_exports(self) -> bool:
+        """Whether background JSON exports are synced to disk before renaming."""
+        return os.getenv('SYNC_EXPORTS', '').strip().lower() in ('1', 'true', 'yes')
 
     def get_contact_email(self) -> str:
         """Return the configured contact email for API requests."""
@@ -53,6 +76,12 @@ class Config:
         """Return the output directory path."""
         return self.output_dir
 
+    def get_cache_dir(self) -> str:
+        """Return the API response cache directory path."""
+        return self.cache_dir
+
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared configuration, creating it on first call."""
+    return Config()
@@ -16,11 +16,16 @@ Requirements:
     - Destination directory must be empty or a git repository
 """
 
+import errno
 import os
+import re
 import shutil
+import stat
 import sys
 from pathlib import Path
 
+from linux_optimized import path_exists
+
 # Files to include in standalone repository
 FILES_TO_COPY = [
     'main.py',
@@ -50,43 +55,205 @@ EXCLUDE = [
 ]
 
 
+# All EXCLUDE substrings as one alternation, so a name is scanned in one pass;
+# an empty EXCLUDE gets the never-matching (?!) rather than '', which matches all
+_EXCLUDE_RE = re.compile('|'.join(re.escape(pattern) for pattern in EXCLUDE) or '(?!)')
+
+
 def should_copy(name):
     """Check if file/dir should be copied."""
-    for exclude in EXCLUDE:
-        if exclude in name:
-            return False
-    return True
+    return _EXCLUDE_RE.search(name) is None
+
+
+# Chunk size for the in-kernel copy calls and the buffered fallback
+_COPY_CHUNK = 1 << 20
+
+# errno values meaning "this copy mechanism does not work for these files"
+_COPY_UNSUPPORTED = {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP, errno.EXDEV}
+
+
+def _copy_fd(src_fd, dst_fd):
+    """Copy all data from src_fd to dst_fd.
+
+    Tries os.sendfile, then os.copy_file_range (both copy inside the kernel),
+    then falls back to a read/write loop over one reused buffer. A mechanism
+    is only abandoned if it fails before writing anything.
+    """
+    if hasattr(os, 'sendfile'):
+        offset = 0
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, _COPY_CHUNK)
+                if sent == 0:
+                    return
+                offset += sent
+        except OSError as e:
+            if offset or e.errno not in _COPY_UNSUPPORTED:
+                raise
+
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK)
+                if n == 0:
+                    return
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in _COPY_UNSUPPORTED:
+                raise
+
+    buffer = bytearray(_COPY_CHUNK)
+    view = memoryview(buffer)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as reader:
+        while True:
+            n = reader.readinto(buffer)
+            if not n:
+                return
+            written = 0
+            while written < n:
+                written += os.write(dst_fd, view[written:n])
+
+
+def _fastcopy(src, dst):
+    """Copy a file with its permission bits and timestamps (like shutil.copy2).
+
+    Works on raw file descriptors so the data can be copied by the kernel,
+    and reuses the single stat of the open source for mode and times.
+    """
+    binary = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o644)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+# fd-relative directory copying needs dir_fd support for opening and creating
+# entries, plus fd-based listing and metadata updates (POSIX; not Windows)
+_DIR_FD_SUPPORTED = (
+    hasattr(os, 'O_DIRECTORY')
+    and {os.open, os.mkdir} <= os.supports_dir_fd
+    and {os.scandir, os.chmod, os.utime} <= os.supports_fd
+)
+
+
+def _copystat_fd(src_fd, dst_fd):
+    """Copy permission bits and timestamps between two open fds."""
+    st = os.fstat(src_fd)
+    os.chmod(dst_fd, stat.S_IMODE(st.st_mode))
+    os.utime(dst_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copy_dir_fd(src_dfd, dst_dfd):
+    """Copy the contents of one open directory into another, recursively.
+
+    Entries are listed with os.scandir(fd), and opened and created with
+    dir_fd=, so no path is resolved from the root again.
+    """
+    with os.scandir(src_dfd) as it:
+        entries = list(it)
+
+    dir_flags = os.O_RDONLY | os.O_DIRECTORY
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir():
+            os.mkdir(name, dir_fd=dst_dfd)
+            child_src = os.open(name, dir_flags, dir_fd=src_dfd)
+            try:
+                child_dst = os.open(name, dir_flags, dir_fd=dst_dfd)
+                try:
+                    _copy_dir_fd(child_src, child_dst)
+                finally:
+                    os.close(child_dst)
+            finally:
+                os.close(child_src)
+        else:
+            src_fd = os.open(name, os.O_RDONLY, dir_fd=src_dfd)
+            try:
+                dst_fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644,
+                                 dir_fd=dst_dfd)
+                try:
+                    _copy_fd(src_fd, dst_fd)
+                    _copystat_fd(src_fd, dst_fd)
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+
+    # Like copytree, set the directory's own metadata once its contents are in
+    _copystat_fd(src_dfd, dst_dfd)
+
+
+def _copytree_fast(src, dst):
+    """Copy directory src to a new directory dst (like shutil.copytree).
+
+    The source and destination directories are each opened once with
+    O_DIRECTORY, and everything below them is handled relative to those
+    fds. Falls back to shutil.copytree (still using _fastcopy for the
+    files) where dir_fd is not supported.
+    """
+    if not _DIR_FD_SUPPORTED:
+        shutil.copytree(src, dst, copy_function=_fastcopy)
+        return
+
+    os.mkdir(dst)
+    dir_flags = os.O_RDONLY | os.O_DIRECTORY
+    src_dfd = os.open(src, dir_flags)
+    try:
+        dst_dfd = os.open(dst, dir_flags)
+        try:
+            _copy_dir_fd(src_dfd, dst_dfd)
+        finally:
+            os.close(dst_dfd)
+    finally:
+        os.close(src_dfd)
 
 
 def copy_project(dest_path):
     """Copy project files to destination."""
-    source_path = Path(__file__).parent
     dest_path = Path(dest_path)
 
     # Create destination if it doesn't exist
     dest_path.mkdir(parents=True, exist_ok=True)
 
+    # Plain strings from here on: they go straight to the os-level copy calls
+    source_dir = os.fspath(Path(__file__).parent)
+    dest_dir = os.fspath(dest_path)
+
     print(f"📋 Copying UniProtKB Protein Finder to: {dest_path}")
     print()
 
+    # One directory read gives the type of every candidate; DirEntry caches
+    # it from readdir, so the checks below need no stat calls
+    with os.scandir(source_dir) as it:
+        entries = {entry.name: entry for entry in it}
+
     # Copy files
     for file in FILES_TO_COPY:
-        src = source_path / file
-        dst = dest_path / file
-        if src.exists():
-            shutil.copy2(src, dst)
+        entry = entries.get(file)
+        if entry is not None and entry.is_file():
+            _fastcopy(entry.path, os.path.join(dest_dir, file))
             print(f"✅ {file}")
         else:
             print(f"⚠️  {file} (not found)")
 
     # Copy directories
     for dir_name in DIRS_TO_COPY:
-        src = source_path / dir_name
-        dst = dest_path / dir_name
-        if src.exists():
-            if dst.exists():
+        entry = entries.get(dir_name)
+        if entry is not None and entry.is_dir():
+            dst = os.path.join(dest_dir, dir_name)
+            if path_exists(dst):
                 shutil.rmtree(dst)
-            shutil.copytree(src, dst)
+            _copytree_fast(entry.path, dst)
             print(f"✅ {dir_name}/")
         else:
             print(f"⚠️  {dir_name}/ (not found)")
@@ -0,0 +1,86 @@
+"""Linux-specific fast paths for filesystem metadata checks.
+
+Existence and file-type checks only need the st_mode type bits. On Linux
+these are fetched with statx(2) (via ctypes), asking the kernel for
+STATX_TYPE only and passing AT_STATX_DONT_SYNC so it never revalidates
+cached attributes with a network filesystem. Other platforms, older
+kernels and libcs without statx fall back to os.stat.
+"""
+
+import ctypes
+import errno
+import functools
+import os
+import sys
+
+# Constants from <fcntl.h> and <linux/stat.h>
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x1
+
+
+class _Statx(ctypes.Structure):
+    """struct statx, naming only the fields up to stx_mode.
+
+    The kernel writes the full 256-byte structure, so it is padded to size.
+    """
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_rest', ctypes.c_uint8 * 226),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_statx():
+    """Return libc's statx function, or None where it is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        # statx needs glibc 2.28+ (or a libc exporting it)
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint,
+                      ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+def stat_mode(path, follow_symlinks=True):
+    """Return st_mode for path, fetching only the file type where possible.
+
+    Only the S_IFMT type bits are guaranteed; use stat.S_ISDIR etc. on the
+    result. Raises OSError (e.g. FileNotFoundError) like os.stat.
+    """
+    statx = _load_statx()
+    if statx is not None:
+        flags = AT_STATX_DONT_SYNC
+        if not follow_symlinks:
+            flags |= AT_SYMLINK_NOFOLLOW
+        encoded = os.fsencode(path)
+        if b'\0' in encoded:
+            raise ValueError('embedded null byte')
+        buf = _Statx()
+        if statx(AT_FDCWD, encoded, flags, STATX_TYPE, ctypes.byref(buf)) == 0:
+            return buf.stx_mode
+        err = ctypes.get_errno()
+        # ENOSYS: kernel older than 4.11; fall through to os.stat
+        if err != errno.ENOSYS:
+            raise OSError(err, os.strerror(err), os.fspath(path))
+    return os.stat(path, follow_symlinks=follow_symlinks).st_mode
+
+
+def path_exists(path):
+    """Return True if path exists (following symlinks), like os.path.exists."""
+    try:
+        stat_mode(path)
+    except (OSError, ValueError):
+        return False
+    return True
@@ -7,24 +7,69 @@ This module handles:
 - Error handling and validation
 """
 
+import asyncio
+import atexit
+import hashlib
+import itertools
 import json
+import os
+import queue
+import time
 import re
 import csv
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Tuple, Union
 
 try:
     import requests
 except ImportError:
     requests = None
 
+# Optional httpx: one pooled client, using HTTP/2 when h2 is installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (only needed for httpx's HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 try:
     from Bio.SeqIO import uniprot_rest_client
 except ImportError:
     uniprot_rest_client = None
 
-from config import config
+# Optional orjson for faster JSON export (falls back to the json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import get_config
+
+# Exceptions raised for failed requests by whichever HTTP library is installed
+_HTTP_ERRORS = tuple(
+    error for error in (
+        getattr(httpx, 'HTTPError', None),
+        getattr(requests, 'RequestException', None),
+    ) if error is not None
+)
+
+# Seconds to wait for each UniProtKB request
+_REQUEST_TIMEOUT = 10
+
+# How long cached entries, and cached "not found" results, stay valid (seconds)
+_ENTRY_CACHE_TTL = 24 * 60 * 60
+_NOT_FOUND_CACHE_TTL = 10 * 60
+
+
+# UniProtKB feature types reported as domains and regions
+_DOMAIN_TYPES = frozenset({'Domain', 'Region', 'Active site', 'Binding site'})
 
 
 class ProteinNotFoundError(Exception):
@@ -42,6 +87,39 @@ class APIError(Exception):
     pass
 
 
+class Domain(NamedTuple):
+    """A domain or region feature of a protein (1-based, inclusive positions).
+
+    sequence is a memoryview into the protein's shared ASCII sequence buffer;
+    decode it with str(domain.sequence, 'ascii') when text is needed.
+    """
+    name: str
+    type: str
+    start: int
+    end: int
+    sequence: memoryview
+
+
+def _read_fresh_cache(path: Path, ttl: float) -> Optional[bytes]:
+    """Return a cache file's contents if it is younger than ttl seconds."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cache(path: Path, content: bytes) -> None:
+    """Atomically replace a cache file; failures only cost a cache miss."""
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 class UniProtKBClient:
     """Client for querying UniProtKB API."""
 
@@ -59,17 +137,56 @@ class UniProtKBClient:
         'Chicken': 'Gallus gallus',
     }
 
+    # Lowercased scientific names, so matching lowercases only the results
+    _SPECIES_SCI_LOWER = {name: sci.lower() for name, sci in SPECIES_MAP.items()}
+
     def __init__(self):
-        """Initialize the UniProtKB client."""
-        if requests is None:
+        """Initialize the UniProtKB client.
+
+        Opens one HTTP session that is reused for every request, so the
+        search and entry fetch share a connection (and a TLS handshake).
+        """
+        if httpx is None and requests is None:
             raise ImportError(
-                "The 'requests' library is required. "
+                "The 'requests' (or 'httpx') library is required. "
                 "Install it with: pip install requests"
             )
+        config = get_config()
         self.base_url = config.uniprotkb_base_url
         self.entry_url = config.uniprotkb_entry_url
         self.contact_email = config.get_contact_email()
-        self.headers = {'User-Agent': f'ProteinFinder/1.0 ({self.contact_email})'}
+        # JSON is requested via content negotiation instead of a format=json
+        # query parameter; responses are gzip-compressed on the wire
+        self.headers = {
+            'User-Agent': f'ProteinFinder/1.0 ({self.contact_email})',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip',
+        }
+        self.cache_dir = Path(config.get_cache_dir())
+
+        if httpx is not None:
+            self._session = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                headers=self.headers,
+                timeout=_REQUEST_TIMEOUT,
+                follow_redirects=True
+            )
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self._session.close()
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        """GET a URL on the shared session, raising for HTTP error statuses."""
+        if httpx is not None:
+            response = self._session.get(url, params=params)
+        else:
+            response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response
 
     def search_protein(
         self,
@@ -94,7 +211,45 @@ class UniProtKBClient:
             The species filter is applied by the UI; the API query only uses protein name
             for reliability. Users should refine results by examining the returned protein's
             species information.
+
+            Entries are cached on disk per (protein_name, species) for 24 hours,
+            and "not found" results for 10 minutes, so repeated searches skip
+            the API entirely.
         """
+        key = hashlib.sha1(f'{protein_name}\0{species or ""}'.encode('utf-8')).hexdigest()
+        entry_file = self.cache_dir / f'{key}.json'
+        not_found_file = self.cache_dir / f'{key}.notfound'
+
+        # The negative cache marker holds the original error message
+        message = _read_fresh_cache(not_found_file, _NOT_FOUND_CACHE_TTL)
+        if message is not None:
+            raise ProteinNotFoundError(message.decode('utf-8'))
+
+        cached = _read_fresh_cache(entry_file, _ENTRY_CACHE_TTL)
+        if cached is not None:
+            try:
+                return orjson.loads(cached) if orjson is not None else json.loads(cached)
+            except ValueError:
+                pass  # Corrupt cache file; fetch again
+
+        try:
+            entry = self._search_uncached(protein_name, species)
+        except ProteinNotFoundError as e:
+            _write_cache(not_found_file, str(e).encode('utf-8'))
+            raise
+
+        _write_cache(
+            entry_file,
+            orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode('utf-8')
+        )
+        return entry
+
+    def _search_uncached(
+        self,
+        protein_name: str,
+        species: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Query UniProtKB for a protein and fetch the chosen entry (no cache)."""
         # Build query - use only protein name for API reliability
         query = protein_name
 
@@ -102,16 +257,9 @@ class UniProtKBClient:
             # Query UniProtKB
             params = {
                 'query': query,
-                'format': 'json',
                 'size': 10  # Get top 10 results to filter by species
             }
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
+            response = self._get(self.base_url, params=params)
 
             data = response.json()
 
@@ -121,25 +269,18 @@ class UniProtKBClient:
                     "Check the protein name and try again."
                 )
 
-            # If species is specified, try to find a matching result
-            entry = None
+            # If species is specified, use the first result from a matching
+            # species; fall back to the first result (don't fail, the user
+            # sees the returned species)
+            results = data['results']
+            entry = results[0]
             if species:
-                species_sci = self.SPECIES_MAP.get(species, species)
-                for result in data['results']:
-                    organism = result.get('organism', {})
-                    result_species = organism.get('scientificName', '')
-                    if species_sci.lower() in result_species.lower():
-                        entry = result
-                        break
-
-                if not entry:
-                    # Fall back to first result if species not found
-                    entry = data['results'][0]
-                    first_species = entry.get('organism', {}).get('scientificName', 'Unknown')
-                    # Don't fail, just inform user
-            else:
-                # No species specified, use first result
-                entry = data['results'][0]
+                species_lower = self._SPECIES_SCI_LOWER.get(species) or species.lower()
+                entry = next(
+                    (result for result in results
+                     if species_lower in result.get('organism', {}).get('scientificName', '').lower()),
+                    entry
+                )
 
             uniprot_id = entry['primaryAccession']
 
@@ -148,8 +289,11 @@ class UniProtKBClient:
 
             return full_entry
 
-        except requests.RequestException as e:
+        except _HTTP_ERRORS as e:
             raise APIError(f"API request failed: {str(e)}")
+        except ValueError as e:
+            # Malformed or truncated JSON body (httpx raises json's error)
+            raise APIError(f"Invalid search response: {str(e)}")
 
     def _fetch_entry(self, uniprot_id: str) -> Dict[str, Any]:
         """Fetch full UniProtKB entry data.
@@ -161,19 +305,14 @@ class UniProtKBClient:
             Dictionary with entry data
         """
         try:
-            url = f'{self.entry_url}/{uniprot_id}'
-            params = {'format': 'json'}
-            response = requests.get(
-                url,
-                params=params,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
+            response = self._get(f'{self.entry_url}/{uniprot_id}')
             return response.json()
 
-        except requests.RequestException as e:
+        except _HTTP_ERRORS as e:
             raise APIError(f"Failed to fetch entry {uniprot_id}: {str(e)}")
+        except ValueError as e:
+            # Malformed or truncated JSON body (httpx raises json's error)
+            raise APIError(f"Invalid entry data for {uniprot_id}: {str(e)}")
 
     def extract_data(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         """Extract protein name, sequence, and domains from a UniProtKB entry.
@@ -182,45 +321,56 @@ class UniProtKBClient:
             entry: Full UniProtKB entry JSON
 
         Returns:
-            Dictionary with extracted data
+            Dictionary with extracted data; 'domains' is a list of Domain
+            records whose sequences are views into one shared buffer
         """
         # Extract basic info
         protein_name = entry.get('uniProtkbId', 'Unknown')
         organism = entry.get('organism', {})
         species = organism.get('scientificName', 'Unknown')
         sequence = entry.get('sequence', {}).get('value', '')
+        seq_len = len(sequence)
+
+        # Encode once; domain sequences are zero-copy views into this buffer
+        sequence_view = memoryview(sequence.encode('ascii', 'replace'))
 
         # Extract features (domains and regions)
         domains = []
         features = entry.get('features', [])
+        # Features sharing a span (e.g. a Domain and a Region) share one view
+        span_views: Dict[Tuple[int, int], memoryview] = {}
 
         for feature in features:
-            feature_type = feature.get('type', '')
-            # Look for domain, region, and active site annotations
-            if feature_type in ['Domain', 'Region', 'Active site', 'Binding site']:
-                location = feature.get('location', {})
-                start = location.get('start', {}).get('value')
-                end = location.get('end', {}).get('value')
-
-                if start is not None and end is not None:
-                    # Extract domain sequence
-                    domain_seq = sequence[start - 1:end] if sequence else ''
-
-                    description = feature.get('description', feature_type)
-
-                    domains.append({
-                        'name': description,
-                        'type': feature_type,
-                        'start': start,
-                        'end': end,
-                        'sequence': domain_seq
-                    })
+            # Features without a type or with an open-ended location are skipped
+            try:
+                feature_type = feature['type']
+                # Look for domain, region, and active site annotations
+                if feature_type not in _DOMAIN_TYPES:
+                    continue
+                location = feature['location']
+                start = location['start']['value']
+                end = location['end']['value']
+            except KeyError:
+                continue
+
+            if start is not None and end is not None:
+                span = (start, end)
+                domain_seq = span_views.get(span)
+                if domain_seq is None:
+                    domain_seq = span_views[span] = sequence_view[start - 1:end]
+                domains.append(Domain(
+                    feature.get('description', feature_type),
+                    feature_type,
+                    start,
+                    end,
+                    domain_seq
+                ))
 
         return {
             'protein_name': protein_name,
             'species': species,
             'full_sequence': sequence,
-            'sequence_length': len(sequence),
+            'sequence_length': seq_len,
             'domains': domains
         }
 
@@ -230,49 +380,186 @@ class UniProtKBClient:
         return list(UniProtKBClient.SPECIES_MAP.keys())
 
 
+def _domain_to_json(
+    domain: Domain,
+    decoded: Optional[Dict[Tuple[int, int], str]] = None
+) -> Dict[str, Any]:
+    """Convert a Domain to a dict, decoding its sequence view to str.
+
+    Pass the same decoded dict for all domains of one protein so domains
+    sharing a span also share one decoded string.
+    """
+    json_domain = domain._asdict()
+    sequence = domain.sequence
+    if not isinstance(sequence, str):
+        span = (domain.start, domain.end)
+        text = decoded.get(span) if decoded is not None else None
+        if text is None:
+            text = str(sequence, 'ascii')
+            if decoded is not None:
+                decoded[span] = text
+        json_domain['sequence'] = text
+    return json_domain
+
+
+def _write_json_file(
+    output_path: Path,
+    json_data: Dict[str, Any],
+    sync: bool = False
+) -> None:
+    """Write json_data to output_path atomically (temp file, then os.replace).
+
+    With sync=True the data is written with O_DSYNC (fsync where that flag
+    is unavailable), so it is on disk before the file appears.
+    """
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly (non-ASCII kept as-is)
+        payload = orjson.dumps(json_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(json_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    dsync = getattr(os, 'O_DSYNC', 0)
+    if sync:
+        flags |= dsync
+
+    tmp_path = output_path.with_name(
+        f'.{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp'
+    )
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync and not dsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, output_path)
+
+
+class _JsonWriterThread(threading.Thread):
+    """Daemon thread writing queued JSON exports to disk in order.
+
+    ProteinDataExporter registers an atexit flush when it starts the
+    writer, so queued exports are written before the interpreter exits.
+    """
+
+    def __init__(self, sync: bool = False):
+        super().__init__(name='json-writer', daemon=True)
+        self.sync = sync
+        self.queue: 'queue.Queue[Tuple[Path, Dict[str, Any]]]' = queue.Queue()
+
+    def run(self) -> None:
+        while True:
+            output_path, json_data = self.queue.get()
+            try:
+                _write_json_file(output_path, json_data, self.sync)
+            except Exception as e:
+                # Don't let one failed export (I/O or serialization) stop the
+                # writer; later exports and flush() depend on it
+                print(f"Warning: Could not write {output_path}: {e}")
+            finally:
+                self.queue.task_done()
+
+
 class ProteinDataExporter:
     """Export protein data to JSON format and manage search history."""
 
     # Search history file path
     HISTORY_FILE = Path(__file__).parent / 'output' / 'search_history.csv'
 
+    # Serializes history appends (and the header check) across worker threads
+    _history_lock = threading.Lock()
+
+    # Numbers auto-generated filenames, so exports within the same second
+    # (e.g. a batch finding one entry twice) never share a path
+    _export_counter = itertools.count(1)
+
+    # Background writer for queue_export, started on first use
+    _writer: Optional[_JsonWriterThread] = None
+    _writer_lock = threading.Lock()
+
     @staticmethod
-    def export_to_json(
+    def _prepare_export(
         data: Dict[str, Any],
         filename: Optional[str] = None
-    ) -> str:
-        """Export protein data to a JSON file.
-
-        Args:
-            data: Dictionary with protein data
-            filename: Output filename (optional; auto-generated if not provided)
-
-        Returns:
-            Path to the created JSON file
-        """
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """Resolve the output path and build the JSON structure for data."""
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             protein_name = data.get('protein_name', 'protein').replace('_', '-')
-            filename = f'protein_{protein_name}_{timestamp}.json'
+            number = next(ProteinDataExporter._export_counter)
+            filename = f'protein_{protein_name}_{timestamp}_{number}.json'
 
-        output_path = Path(config.get_output_dir()) / filename
+        output_path = Path(get_config().get_output_dir()) / filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Prepare JSON structure
+        decoded: Dict[Tuple[int, int], str] = {}
+        seq_len = data.get('sequence_length', 0)
         json_data = {
             'protein_name': data.get('protein_name', ''),
             'species': data.get('species', ''),
             'full_sequence': data.get('full_sequence', ''),
-            'sequence_length': data.get('sequence_length', 0),
-            'domains': data.get('domains', []),
+            'sequence_length': seq_len,
+            'domains': [_domain_to_json(domain, decoded) for domain in data.get('domains', [])],
             'exported_at': datetime.now().isoformat()
         }
+        return output_path, json_data
+
+    @staticmethod
+    def export_to_json(
+        data: Dict[str, Any],
+        filename: Optional[str] = None
+    ) -> str:
+        """Export protein data to a JSON file.
+
+        Args:
+            data: Dictionary with protein data
+            filename: Output filename (optional; auto-generated if not provided)
+
+        Returns:
+            Path to the created JSON file
+        """
+        output_path, json_data = ProteinDataExporter._prepare_export(data, filename)
+        _write_json_file(output_path, json_data)
+        return str(output_path)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+    @classmethod
+    def queue_export(
+        cls,
+        data: Dict[str, Any],
+        filename: Optional[str] = None
+    ) -> str:
+        """Queue protein data for export by the background writer thread.
 
+        The JSON structure is built (and the path chosen) immediately; only
+        the disk write is deferred. Use flush() to wait for queued writes.
+
+        Args:
+            data: Dictionary with protein data
+            filename: Output filename (optional; auto-generated if not provided)
+
+        Returns:
+            Path the JSON file will be written to
+        """
+        output_path, json_data = cls._prepare_export(data, filename)
+        with cls._writer_lock:
+            if cls._writer is None:
+                cls._writer = _JsonWriterThread(sync=get_config().sync_exports)
+                cls._writer.start()
+                # The writer is a daemon thread; drain its queue at exit
+                atexit.register(cls.flush)
+        cls._writer.queue.put((output_path, json_data))
         return str(output_path)
 
+    @classmethod
+    def flush(cls) -> None:
+        """Block until every queued export has been written."""
+        if cls._writer is not None:
+            cls._writer.queue.join()
+
     @staticmethod
     def log_search_to_history(
         protein_name: str,
@@ -288,18 +575,16 @@ class ProteinDataExporter:
 
         File format: timestamp, protein_name, species, success
         """
-        history_file = Path(config.get_output_dir()) / 'search_history.csv'
+        history_file = Path(get_config().get_output_dir()) / 'search_history.csv'
         history_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if file exists to determine if we need headers
-        file_exists = history_file.exists()
-
         try:
-            with open(history_file, 'a', newline='', encoding='utf-8') as f:
+            with ProteinDataExporter._history_lock, \
+                    open(history_file, 'a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
 
                 # Write header if file is new
-                if not file_exists:
+                if f.tell() == 0:
                     writer.writerow(['timestamp', 'protein_name', 'species', 'success'])
 
                 # Write search record
@@ -322,6 +607,16 @@ class ProteinSearchService:
         self.client = UniProtKBClient()
         self.exporter = ProteinDataExporter()
 
+    def close(self) -> None:
+        """Release the client's HTTP connections."""
+        self.client.close()
+
+    def __enter__(self) -> 'ProteinSearchService':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def search(
         self,
         protein_name: str,
@@ -375,14 +670,49 @@ class ProteinSearchService:
         """
         data = self.search(protein_name, species)
 
-        # Export to JSON
-        json_path = self.exporter.export_to_json(data)
+        # Hand the write to the background writer; the path is known now
+        json_path = self.exporter.queue_export(data)
 
         status_message = (
             f"✓ Successfully found protein '{data['protein_name']}' "
             f"from {data['species']}. "
-            f"Data saved to:\n{json_path}"
+            f"Data queued for saving to:\n{json_path}"
         )
 
         return json_path, status_message
 
+    async def search_and_export_many(
+        self,
+        queries: Iterable[Tuple[str, Optional[str]]],
+        max_concurrency: int = 4
+    ) -> List[Union[Tuple[str, str], Exception]]:
+        """Search for and export several proteins concurrently.
+
+        Each query runs search_and_export in a worker thread
+        (asyncio.to_thread), so the network round-trips of different
+        proteins overlap; their JSON files are written in turn by the
+        exporter's writer thread. At most max_concurrency queries are in
+        flight at once to stay within UniProtKB rate limits. Returns once
+        every export has been written.
+
+        Args:
+            queries: (protein_name, species) pairs; species may be None
+            max_concurrency: Maximum number of simultaneous queries
+
+        Returns:
+            One entry per query, in order: the (json_file_path, status_message)
+            tuple, or the exception that query raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(protein_name: str, species: Optional[str]) -> Tuple[str, str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.search_and_export, protein_name, species)
+
+        results = await asyncio.gather(
+            *(run(protein_name, species) for protein_name, species in queries),
+            return_exceptions=True
+        )
+        # Wait for the writer thread so every returned path exists
+        await asyncio.to_thread(ProteinDataExporter.flush)
+        return results
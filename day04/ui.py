@@ -6,10 +6,12 @@ sequence and domain information from UniProtKB.
 
 import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox
 from typing import Optional, Callable
 
 from logic import (
+    ProteinDataExporter,
     ProteinSearchService,
     ProteinNotFoundError,
     SpeciesNotFoundError,
@@ -35,6 +37,20 @@ class ProteinFinderGUI:
         self.service = ProteinSearchService()
         self.is_searching = False
 
+        # Searches run on a persistent pool instead of a new thread per click
+        self._executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='protein-search'
+        )
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+        # Set once the window is closing; a search still running then
+        # finishes without touching the destroyed widgets
+        self._closing = False
+
+        # Latest status not yet drawn; updates are coalesced into one redraw
+        self._pending_status = None
+        self._status_lock = threading.Lock()
+
         self._build_ui()
 
     def _build_ui(self):
@@ -140,13 +156,58 @@ class ProteinFinderGUI:
             messagebox.showerror('Input Error', 'Please enter a protein name.')
             return
 
-        # Start search in background thread to keep UI responsive
-        thread = threading.Thread(
-            target=self._search_worker,
-            args=(protein_name, species),
-            daemon=True
+        # Start search in background thread to keep UI responsive; the busy
+        # flag is only touched on the main thread
+        self.is_searching = True
+        future = self._executor.submit(self._search_worker, protein_name, species)
+        future.add_done_callback(
+            lambda f: self._call_on_main_thread(self.root.after, 0, self._on_search_done, f)
         )
-        thread.start()
+
+    def _call_on_main_thread(self, schedule: Callable, *args):
+        """Schedule a callback with root.after/after_idle unless the window is closing.
+
+        Args:
+            schedule: self.root.after or self.root.after_idle
+            *args: Arguments for schedule
+        """
+        if self._closing:
+            return
+        try:
+            schedule(*args)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call
+            pass
+
+    def _on_search_done(self, future: Future):
+        """Clear the busy flag once a search finishes (runs on main thread).
+
+        Args:
+            future: The finished search
+        """
+        self.is_searching = False
+
+    def _on_close(self):
+        """Cancel queued searches, flush queued exports and close the window.
+
+        The HTTP session is released once a search still running has
+        finished with it.
+        """
+        self._closing = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # Finish any JSON exports still queued for the writer thread
+        ProteinDataExporter.flush()
+        self.root.destroy()
+        threading.Thread(
+            target=self._close_service_when_idle,
+            name='protein-search-close',
+            daemon=True
+        ).start()
+
+    def _close_service_when_idle(self):
+        """Wait for the search pool to drain, then close the service."""
+        self._executor.shutdown(wait=True)
+        self.service.close()
 
     def _search_worker(self, protein_name: str, species: Optional[str]):
         """Worker thread for protein search.
@@ -155,7 +216,6 @@ class ProteinFinderGUI:
             protein_name: Name of the protein
             species: Species (optional)
         """
-        self.is_searching = True
         self._update_status('Searching...', 'blue')
 
         try:
@@ -185,9 +245,6 @@ class ProteinFinderGUI:
                 'red'
             )
 
-        finally:
-            self.is_searching = False
-
     def _format_results(self, data: dict) -> str:
         """Format protein data for display.
 
@@ -206,24 +263,39 @@ class ProteinFinderGUI:
         result += f"{'='*60}\n"
 
         for i, domain in enumerate(data['domains'], 1):
-            result += f"\n[{i}] {domain['name'] or domain['type']}\n"
-            result += f"    Type: {domain['type']}\n"
-            result += f"    Position: {domain['start']}-{domain['end']}\n"
-            if domain['sequence']:
-                seq_preview = domain['sequence'][:50]
-                seq_preview += "..." if len(domain['sequence']) > 50 else ""
+            result += f"\n[{i}] {domain.name or domain.type}\n"
+            result += f"    Type: {domain.type}\n"
+            result += f"    Position: {domain.start}-{domain.end}\n"
+            if domain.sequence:
+                # Only the previewed part of the sequence view is decoded
+                seq_preview = str(domain.sequence[:50], 'ascii')
+                seq_preview += "..." if len(domain.sequence) > 50 else ""
                 result += f"    Sequence: {seq_preview}\n"
 
         return result
 
     def _update_status(self, message: str, color: str = 'black'):
-        """Update status text area.
+        """Update status text area (safe to call from any thread).
+
+        Only the latest message is kept; the redraw is scheduled once with
+        after_idle, so a burst of updates costs a single widget update.
 
         Args:
             message: Status message to display
             color: Text color ('black', 'green', 'red', 'blue')
         """
-        self.root.after(0, self._do_update_status, message, color)
+        with self._status_lock:
+            flush_scheduled = self._pending_status is not None
+            self._pending_status = (message, color)
+        if not flush_scheduled:
+            self._call_on_main_thread(self.root.after_idle, self._flush_status)
+
+    def _flush_status(self):
+        """Draw the pending status, if any (runs on main thread)."""
+        with self._status_lock:
+            pending, self._pending_status = self._pending_status, None
+        if pending is not None:
+            self._do_update_status(*pending)
 
     def _do_update_status(self, message: str, color: str):
         """Actually update the status text (must run on main thread).
@@ -233,8 +305,7 @@ class ProteinFinderGUI:
             color: Text color
         """
         self.status_text.config(state='normal')
-        self.status_text.delete('1.0', 'end')
-        self.status_text.insert('1.0', message)
+        self.status_text.replace('1.0', 'end', message)
         self.status_text.tag_configure('status_color', foreground=color)
         self.status_text.tag_add('status_color', '1.0', 'end')
         self.status_text.config(state='disabled')
@@ -1,6 +1,9 @@
 """Guessing game module with core logic and game loop."""
 
-import random
+from secrets import randbelow
+
+# check_guess results indexed by the sign of (target_number - guess) + 1
+_RESULTS = ("Smaller", "Found", "Larger")
 
 
 def check_guess(guess, target_number):
@@ -16,17 +19,13 @@ def check_guess(guess, target_number):
         "Larger" if guess is smaller than target_number
         "Smaller" if guess is larger than target_number
     """
-    if guess == target_number:
-        return "Found"
-    elif guess < target_number:
-        return "Larger"
-    else:
-        return "Smaller"
+    # Sign of (target_number - guess) as -1, 0 or 1, shifted to index _RESULTS
+    return _RESULTS[(target_number > guess) - (target_number < guess) + 1]
 
 
 def run_game():
     """Run the main game loop with user interaction."""
-    r = random.randint(1, 100)
+    r = randbelow(100) + 1  # 1..100
     counter = 0
     print("Welcome to the Guessing Game!")
     while True: